@@ -1,6 +1,7 @@
-from .adt import ADT
+from .adt import ADT, deferred, replace
 from .case import case, match
+from .memory import memory_usage
 
 __version__ = '0.1.0'
 
-__all__ = ['ADT', 'case', 'match']
+__all__ = ['ADT', 'case', 'deferred', 'match', 'memory_usage', 'replace']
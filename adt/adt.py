@@ -1,10 +1,22 @@
 from collections import OrderedDict
 from functools import total_ordering
+from gc import is_tracked
 
-from toolz import concatv, memoize, identity
+from lazy import thunk, strict
+from toolz import concatv, memoize, identity, merge
 import toolz.curried.operator as op
 
 
+try:
+    from ctypes import PYFUNCTYPE, py_object, pythonapi
+    gc_untrack = PYFUNCTYPE(None, py_object)(
+        ('PyObject_GC_UnTrack', pythonapi),
+    )
+except (ImportError, AttributeError):  # pragma: no cover
+    # not running on CPython, instances stay tracked by the cyclic gc
+    gc_untrack = None
+
+
 class NamespaceObject:
     __slots__ = '_recursivetype', '_constructortype', '_name', '_constructors'
 
@@ -70,6 +82,29 @@ class Constructor:
     __or__ = staticmethod(identity)
 
 
+class deferred:
+    """Mark a constructor field as lazy.
+
+    A deferred field accepts a :class:`lazy.thunk` which is only evaluated and
+    type checked the first time the field is accessed. The result is cached on
+    the instance.
+
+    Examples
+    --------
+    >>> class Stream(ADT):
+    ...     Empty()
+    ...     Cons(_1, deferred(Stream[_1]))
+    """
+    __slots__ = '_type',
+
+    def __init__(self, type_):
+        self._type = type_
+
+    def __repr__(self):
+        return 'deferred(%s)' % self._type
+    __str__ = __repr__
+
+
 @total_ordering
 class TypeVar:
     __slots__ = '_name'
@@ -85,6 +120,71 @@ class TypeVar:
         return self._name < other._name
 
 
+def check_type(cls, type_, value, where):
+    if isinstance(type_, TypeVar):
+        type_ = cls._types[type_]
+    if not isinstance(value, type_):
+        raise TypeError(
+            'expected type %r for argument at %s, got %r: %r' % (
+                type_.__name__,
+                where,
+                type(value).__name__,
+                value,
+            ),
+        )
+
+
+def may_be_tracked(ob):
+    # untracked dicts become tracked again when a container is inserted
+    return is_tracked(ob) or isinstance(ob, dict)
+
+
+def maybe_untrack(self):
+    """Stop the cyclic garbage collector from tracking a constructor instance
+    which cannot be part of a reference cycle.
+
+    Like CPython does for tuples, an instance is untracked when none of its
+    fields are tracked. Constructors with deferred fields are never untracked
+    because forcing a field may store a container on the instance.
+    """
+    if not type(self)._untrack:
+        return
+
+    args = self._args
+    kwargs = self._kwargs
+    if (any(map(may_be_tracked, args)) or
+            any(map(may_be_tracked, kwargs.values()))):
+        return
+
+    # CPython keeps containers which hold instances tracked even if the
+    # instances are not, so the field storage must be untracked too
+    if is_tracked(args):
+        gc_untrack(args)
+    if is_tracked(kwargs):
+        gc_untrack(kwargs)
+    gc_untrack(self)
+
+
+def check_deferred_fields(cls, args, kwargs):
+    """Type check the fields of a constructor which has deferred fields.
+
+    Deferred fields which are given a thunk are checked when they are first
+    accessed.
+    """
+    lazyargs = cls._lazyargs
+    for n, (arg, type_) in enumerate(zip(args, cls._argtypes)):
+        if n in lazyargs and isinstance(arg, thunk):
+            continue
+        check_type(cls, type_, arg, 'position %d' % n)
+
+    kwargtypes = cls._kwargtypes
+    lazykwargs = cls._lazykwargs
+    for k, v in kwargs.items():
+        if k in lazykwargs and isinstance(v, thunk):
+            continue
+        check_type(cls, kwargtypes[k], v, repr(k))
+
+
 def constructor_new(cls, *args, **kwargs):
     if len(args) != len(cls._argtypes):
         raise TypeError(
@@ -103,61 +203,215 @@ def constructor_new(cls, *args, **kwargs):
             ),
         )
 
-    types = cls._types
-    for n, (arg, type_) in enumerate(zip(args, cls._argtypes)):
-        if isinstance(type_, TypeVar):
-            type_ = types[type_]
-        if not isinstance(arg, type_):
-            raise TypeError(
-                'expected type %r for argument at position %d, got %r: %r' % (
-                    type_.__name__,
-                    n,
-                    type(arg).__name__,
-                    arg,
-                ),
-            )
+    lazyargs = cls._lazyargs
+    lazykwargs = cls._lazykwargs
+    if lazyargs or lazykwargs:
+        check_deferred_fields(cls, args, kwargs)
+    else:
+        types = cls._types
+        for n, (arg, type_) in enumerate(zip(args, cls._argtypes)):
+            if isinstance(type_, TypeVar):
+                type_ = types[type_]
+            if not isinstance(arg, type_):
+                raise TypeError(
+                    'expected type %r for argument at position %d, got %r:'
+                    ' %r' % (
+                        type_.__name__,
+                        n,
+                        type(arg).__name__,
+                        arg,
+                    ),
+                )
 
-    kwargtypes = cls._kwargtypes
-    for k, v in kwargs.items():
-        type_ = kwargtypes[k]
-        if isinstance(type_, TypeVar):
-            type_ = types[type_]
-        if not isinstance(v, type_):
-            raise TypeError(
-                'expected type %r for argument at %r, got %r: %r' % (
-                    type_.__name__,
-                    k,
-                    type(v).__name__,
-                    v,
-                ),
-            )
+        kwargtypes = cls._kwargtypes
+        for k, v in kwargs.items():
+            type_ = kwargtypes[k]
+            if isinstance(type_, TypeVar):
+                type_ = types[type_]
+            if not isinstance(v, type_):
+                raise TypeError(
+                    'expected type %r for argument at %r, got %r: %r' % (
+                        type_.__name__,
+                        k,
+                        type(v).__name__,
+                        v,
+                    ),
+                )
 
     self = object.__new__(cls)
     self._args = args
     self._kwargs = kwargs
+    maybe_untrack(self)
+    return self
 
-    for k, v in kwargs.items():
-        setattr(self, k, v)
 
-    return self
+def force_field(self, key):
+    """Get the value of a field, evaluating it if it is deferred.
+
+    Parameters
+    ----------
+    self : ADT
+        The constructor instance.
+    key : int or str
+        The index of a positional field or the name of a keyword field.
+
+    Returns
+    -------
+    value : any
+        The value of the field.
+    """
+    cls = type(self)
+    if isinstance(key, str):
+        storage = self._kwargs
+        value = storage[key]
+        if key not in cls._lazykwargs or not isinstance(value, thunk):
+            return value
+
+        value = strict(value)
+        check_type(cls, cls._kwargtypes[key], value, repr(key))
+        storage[key] = value
+        return value
+
+    args = self._args
+    value = args[key]
+    if key < 0:
+        key += len(args)
+    if key not in cls._lazyargs or not isinstance(value, thunk):
+        return value
+
+    value = strict(value)
+    check_type(cls, cls._argtypes[key], value, 'position %d' % key)
+    self._args = args[:key] + (value,) + args[key + 1:]
+    return value
+
+
+def kwarg_property(key, lazy):
+    # keyword fields are only stored in ``_kwargs`` so that ``replace`` can
+    # share the storage of the fields which do not change
+    if lazy:
+        return property(lambda self: force_field(self, key))
+    return property(lambda self: self._kwargs[key])
 
 
 def constructor_getitem(self, key):
-    return self._args[key]
+    if not type(self)._lazyargs:
+        return self._args[key]
+    if isinstance(key, slice):
+        return tuple(
+            force_field(self, n)
+            for n in range(*key.indices(len(self._args)))
+        )
+    return force_field(self, key)
+
+
+def replace(self, _positional=None, **kwargs):
+    """Create a copy of a constructor instance with some fields changed.
+
+    Only the changed fields are type checked, the rest of the fields are
+    shared with ``self``.
+
+    Parameters
+    ----------
+    self : ADT
+        The constructor instance to update.
+    _positional : dict[int, any], optional
+        A mapping from the index of a positional field to its new value.
+    **kwargs
+        The new values for keyword fields.
+
+    Returns
+    -------
+    updated : ADT
+        A new instance of the same constructor.
+
+    Examples
+    --------
+    >>> class Pair(ADT):
+    ...     P(_1, _1, tag=_2)
+    >>> p = Pair[int, str].P(1, 2, tag='a')
+    >>> replace(p, {1: 3}, tag='b')
+    Pair[int, str].P(1, 3, tag=b)
+    >>> p.replace(tag='c')
+    Pair[int, str].P(1, 2, tag=c)
+    """
+    cls = type(self)
+    new = object.__new__(cls)
+
+    args = self._args
+    if _positional:
+        argtypes = cls._argtypes
+        lazyargs = cls._lazyargs
+        args = list(args)
+        for n, arg in _positional.items():
+            if not -len(args) <= n < len(args):
+                raise IndexError(
+                    '%r has %d positional arguments, got index %d' % (
+                        cls.__name__,
+                        len(args),
+                        n,
+                    ),
+                )
+            if n < 0:
+                n += len(args)
+            if not (n in lazyargs and isinstance(arg, thunk)):
+                check_type(cls, argtypes[n], arg, 'position %d' % n)
+            args[n] = arg
+        args = tuple(args)
+    new._args = args
+
+    if not kwargs:
+        # the keyword storage is only written to when forcing a deferred
+        # field, which gives the same value for both instances
+        new._kwargs = self._kwargs
+        maybe_untrack(new)
+        return new
+
+    kwargtypes = cls._kwargtypes
+    lazykwargs = cls._lazykwargs
+    for k, v in kwargs.items():
+        if k not in kwargtypes:
+            raise TypeError(
+                'unknown keyword argument %r, expected one of %r' % (
+                    k,
+                    set(kwargtypes.keys()),
+                ),
+            )
+        if k in lazykwargs and isinstance(v, thunk):
+            continue
+        check_type(cls, kwargtypes[k], v, repr(k))
+
+    new._kwargs = merge(self._kwargs, kwargs)
+    maybe_untrack(new)
+    return new
+
+
+def field_repr(value, lazy):
+    if lazy and isinstance(value, thunk):
+        # don't force the value just to show it
+        return '<deferred>'
+    return str(value)
 
 
 def constructor_repr(self):
+    cls = type(self)
     return '%s(%s%s%s)' % (
-        type(self),
-        ', '.join(map(str, self._args)),
+        cls,
+        ', '.join(
+            field_repr(arg, n in cls._lazyargs)
+            for n, arg in enumerate(self._args)
+        ),
         ', ' if self._args and self._kwargs else '',
-        ', '.join(map(op.mod('%s=%s'), self._kwargs.items())),
+        ', '.join(
+            '%s=%s' % (k, field_repr(v, k in cls._lazykwargs))
+            for k, v in self._kwargs.items()
+        ),
     )
 
 
 class _isconstructor:
     """Type trait to mark that a class is a constructor.
     """
+    __slots__ = ()
 
 
 @memoize
@@ -170,14 +424,18 @@ def adt(base, types):
         base.__name__,
         (base,),
         {
-            '__slots__': ('_args', '_kwargs'),
+            '__slots__': ('_args', '_kwargs', '__weakref__'),
             '_types': _types,
         },
     )
 
     for constructor in base._constructors:
         argtypes = list(constructor._args)
+        lazyargs = set()
         for n, argtype in enumerate(argtypes):
+            if isinstance(argtype, deferred):
+                lazyargs.add(n)
+                argtype = argtype._type
             if (isinstance(argtype, RecursiveType) and
                     argtype._name == base.__name__):
                 # recursive structure
@@ -190,7 +448,11 @@ def adt(base, types):
             else:
                 argtypes[n] = argtype
         kwargtypes = dict(constructor._kwargs)
+        lazykwargs = set()
         for k, kwargtype in constructor._kwargs.items():
+            if isinstance(kwargtype, deferred):
+                lazykwargs.add(k)
+                kwargtype = kwargtypes[k] = kwargtype._type
             if (isinstance(kwargtype, RecursiveType) and
                     kwargtype._name == base.__name__):
                 # recursive structure
@@ -208,14 +470,34 @@ def adt(base, types):
             type(
                 constructor._name,
                 (ADTImpl, _isconstructor),
-                {
-                    '__new__': constructor_new,
-                    '_adt': ADTImpl,
-                    '_argtypes': argtypes,
-                    '_kwargtypes': kwargtypes,
-                    '__getitem__': constructor_getitem,
-                    '__repr__': constructor_repr,
-                },
+                merge(
+                    {
+                        '__slots__': (),
+                        '__new__': constructor_new,
+                        '_adt': ADTImpl,
+                        '_argtypes': argtypes,
+                        '_kwargtypes': kwargtypes,
+                        '_lazyargs': frozenset(lazyargs),
+                        '_lazykwargs': frozenset(lazykwargs),
+                        '_untrack': (
+                            base._untrack and
+                            gc_untrack is not None and
+                            not lazyargs and
+                            not lazykwargs
+                        ),
+                        '__getitem__': constructor_getitem,
+                        '__repr__': constructor_repr,
+                    },
+                    # don't shadow a user defined method or a field with
+                    # the same name, ``adt.replace`` still works on these
+                    {}
+                    if 'replace' in base.__dict__ or 'replace' in kwargtypes
+                    else {'replace': replace},
+                    {
+                        k: kwarg_property(k, k in lazykwargs)
+                        for k in kwargtypes
+                    },
+                ),
             ),
         )
     return ADTImpl
@@ -223,7 +505,7 @@ def adt(base, types):
 
 def mk_prepare_structure(RecursiveType, Constructor, TypeVar, valid_arg_names):
     class __prepare__(dict):
-        def __init__(self, instance, owner):
+        def __init__(self, instance, owner, **kwargs):
             super().__init__()
             self._typevars = {}
             self._constructors = OrderedDict()
@@ -256,9 +538,14 @@ def mk_prepare_structure(RecursiveType, Constructor, TypeVar, valid_arg_names):
 
 
 class ADTMeta(type):
-    def __new__(mcls, name, bases, dict_):
+    def __new__(mcls, name, bases, dict_, untrack=False):
+        if len(bases) and bases[0] is ADT and '__slots__' not in dict_:
+            # instances are immutable, they only hold ``_args`` and
+            # ``_kwargs``
+            dict_['__slots__'] = ()
         self = super().__new__(mcls, name, bases, dict_)
         if len(bases) and bases[0] is ADT:
+            self._untrack = untrack
             self._typevars = dict_._typevars
             self._constructors = tuple(dict_._constructors.values())
             constructors = set(self._constructors)
@@ -268,6 +555,8 @@ class ADTMeta(type):
                     constructor._kwargs.values(),
                 )
                 for t in types:
+                    if isinstance(t, deferred):
+                        t = t._type
                     if isinstance(t, RecursiveType) and t._name != name:
                         raise TypeError(
                             'recursive type name must be the same as the type'
@@ -285,6 +574,9 @@ class ADTMeta(type):
                 return adt(self, ())
         return self
 
+    def __init__(self, name, bases, dict_, untrack=False):
+        super().__init__(name, bases, dict_)
+
     __prepare__ = mk_prepare_structure(
         RecursiveType,
         Constructor,
@@ -324,6 +616,8 @@ class ADTMeta(type):
 
 
 class ADT(metaclass=ADTMeta):
+    __slots__ = ()
+
     def __new__(cls, *args):
         if cls is ADT:
             raise TypeError('Cannot create instances of %r' % cls.__name__)
@@ -1,4 +1,5 @@
 import builtins
+from collections import OrderedDict, namedtuple
 from functools import partial
 import sys
 
@@ -6,7 +7,11 @@ from lazy import thunk, strict, operator as op
 from lazy.tree import LTree, Call, Normal
 from toolz import curry, merge, valmap
 
-from .adt import mk_prepare_structure, Constructor as ADTConstructor
+from .adt import (
+    mk_prepare_structure,
+    Constructor as ADTConstructor,
+    force_field,
+)
 
 
 class RegisteringThunk(thunk):
@@ -120,6 +125,17 @@ class NoMatch(Exception):
     """
 
 
+def bind_field(scrutinee, key, value, deferred_keys):
+    """Get the value to bind to a name in an alternative.
+
+    Deferred fields which have not been evaluated are bound to a thunk so
+    that they are only evaluated if the alternative uses them.
+    """
+    if key in deferred_keys and isinstance(value, thunk):
+        return thunk(force_field, scrutinee, key)
+    return value
+
+
 class Alternative:
     __slots__ = (
         '_constructor_name',
@@ -146,7 +162,10 @@ class Alternative:
         if constructor.__name__ != self._constructor_name:
             raise NoMatch()
 
+        args = scrutine._args
+        lazyargs = constructor._lazyargs
         kwargs = scrutine._kwargs
+        lazykwargs = constructor._lazykwargs
         # the context to evaluate the thunk in
         context = {
             Call(Normal(name_lookup), (Normal(name),), {}): Normal(value)
@@ -155,8 +174,14 @@ class Alternative:
                 context_frame.f_globals,
                 context_frame.f_locals,
                 # the newly bound arguments have the highest precedence
-                dict(zip(self._argnames, scrutine._args)),
-                {v: kwargs[k] for k, v in self._kwargnames.items()},
+                {
+                    name: bind_field(scrutine, n, args[n], lazyargs)
+                    for n, name in enumerate(self._argnames)
+                },
+                {
+                    v: bind_field(scrutine, k, kwargs[k], lazykwargs)
+                    for k, v in self._kwargnames.items()
+                },
             ).items()
         }
         bound_tree = LTree.parse(self._expr).subs(context)
@@ -166,6 +191,19 @@ class Alternative:
         return self._constructor_name
 
 
+def calling_frame(depth):
+    """Get the frame to look up names in for a case statement.
+
+    If the case statement is called from inside of an alternative, for example
+    a recursive case statement, use the frame that the alternative is being
+    evaluated in.
+    """
+    frame = sys._getframe(depth + 1)
+    if frame.f_code is Alternative.scrutinize.__code__:
+        return frame.f_locals['context_frame']
+    return frame
+
+
 def scrutinize(alternatives, scrutinee, context_frame=None):
     # validate the case statement based on the scrutinee
     adt = scrutinee._adt
@@ -199,8 +237,7 @@ def scrutinize(alternatives, scrutinee, context_frame=None):
             )
 
     if context_frame is None:
-        # the calling frame
-        context_frame = sys._getframe(1)
+        context_frame = calling_frame(1)
     for alternative in alternatives:
         try:
             return alternative.scrutinize(scrutinee, context_frame)
@@ -215,6 +252,91 @@ def scrutinize(alternatives, scrutinee, context_frame=None):
     )
 
 
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+class MemoizedCase:
+    """A case statement which caches its results.
+
+    Results are keyed on the identity of the scrutinee. At most ``maxsize``
+    results are kept, the least recently used result is evicted first.
+
+    Parameters
+    ----------
+    alternatives : iterable[Alternative]
+        The alternatives of the case statement.
+    maxsize : int
+        The maximum number of results to cache.
+
+    Notes
+    -----
+    The case statement must be a pure function of the scrutinee, names looked
+    up in the calling frame are not part of the cache key.
+    """
+    __slots__ = '_alternatives', '_maxsize', '_cache', '_hits', '_misses'
+
+    def __init__(self, alternatives, maxsize):
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+            raise TypeError(
+                'maxsize must be an int, got %r: %r' % (
+                    type(maxsize).__name__,
+                    maxsize,
+                ),
+            )
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1, got %r' % maxsize)
+        self._alternatives = alternatives
+        self._maxsize = maxsize
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, scrutinee, context_frame=None):
+        cache = self._cache
+        key = id(scrutinee)
+        try:
+            _, result = cache[key]
+        except KeyError:
+            pass
+        else:
+            cache.move_to_end(key)
+            self._hits += 1
+            return result
+
+        self._misses += 1
+        if context_frame is None:
+            context_frame = calling_frame(1)
+        result = scrutinize(self._alternatives, scrutinee, context_frame)
+        # hold a reference to the scrutinee so that its id is not reused while
+        # it is in the cache
+        cache[key] = scrutinee, result
+        if len(cache) > self._maxsize:
+            cache.popitem(last=False)
+        return result
+
+    def cache_info(self):
+        """Report the cache statistics.
+
+        Returns
+        -------
+        info : CacheInfo
+            The hits, misses, maxsize and current size of the cache.
+        """
+        return CacheInfo(
+            self._hits,
+            self._misses,
+            self._maxsize,
+            len(self._cache),
+        )
+
+    def cache_clear(self):
+        """Clear the cache and the statistics.
+        """
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+
 def no_recursive_type(*args, **kwargs):
     raise TypeError('cannot use recursive types in case statements')
 
@@ -228,7 +350,7 @@ class everything:
 class CaseMeta(type):
     _marker = object()
 
-    def __new__(mcls, name, bases, dict_):
+    def __new__(mcls, name, bases, dict_, memoize=None):
         if bases and bases[0] is mcls._marker:
             return super().__new__(mcls, name, (), dict_)
 
@@ -257,6 +379,8 @@ class CaseMeta(type):
                 except (KeyError, TypeError):
                     pass
 
+        if memoize is not None:
+            return MemoizedCase(tuple(altconstructors.values()), memoize)
         return partial(scrutinize, altconstructors.values())
 
     __prepare__ = mk_prepare_structure(
@@ -269,6 +393,15 @@ class CaseMeta(type):
 
 class case(CaseMeta._marker, metaclass=CaseMeta):
     """Convenience for creating case statements.
+
+    Pure case statements may cache their results by passing the maximum number
+    of results to keep as ``memoize``.
+
+    Examples
+    --------
+    >>> class evaluate(case, memoize=128):  # doctest: +SKIP
+    ...     Lit(value) >> value
+    ...     Add(lhs, rhs) >> evaluate(lhs) + evaluate(rhs)
     """
 
 
@@ -0,0 +1,189 @@
+from sys import getsizeof
+
+from toolz import concatv
+
+from .adt import _isconstructor
+
+
+_sequences = frozenset({list, tuple, set, frozenset})
+
+
+def contents(obj):
+    """Get the objects held by a builtin container.
+
+    Parameters
+    ----------
+    obj : any
+        The object to look inside.
+
+    Returns
+    -------
+    contents : iterable
+        The elements of ``obj`` if it is a ``list``, ``tuple``, ``set`` or
+        ``frozenset``, the keys and values of ``obj`` if it is a ``dict``,
+        otherwise nothing.
+    """
+    # use ``type`` instead of ``isinstance`` so that we don't force thunks
+    type_ = type(obj)
+    if type_ in _sequences:
+        return obj
+    if type_ is dict:
+        return concatv(obj.keys(), obj.values())
+    return ()
+
+
+class MemoryUsage:
+    """The memory used by an ADT value.
+
+    Attributes
+    ----------
+    total_bytes : int
+        The number of bytes used by every object reachable from the value
+        through ADT fields and builtin containers.
+    shared_bytes : int
+        The number of bytes used by objects which are reachable along more than
+        one path.
+    unique_bytes : int
+        The number of bytes used by objects which are reachable along exactly
+        one path.
+    instances : dict[type, int]
+        The number of instances of each constructor.
+    constructor_bytes : dict[type, int]
+        The number of bytes used by the instances of each constructor and their
+        field storage, not including the field values.
+    """
+    __slots__ = (
+        'total_bytes',
+        'shared_bytes',
+        'unique_bytes',
+        'instances',
+        'constructor_bytes',
+    )
+
+    def __init__(self,
+                 total_bytes,
+                 shared_bytes,
+                 instances,
+                 constructor_bytes):
+        self.total_bytes = total_bytes
+        self.shared_bytes = shared_bytes
+        self.unique_bytes = total_bytes - shared_bytes
+        self.instances = instances
+        self.constructor_bytes = constructor_bytes
+
+    def __repr__(self):
+        return '%s(total_bytes=%d, shared_bytes=%d, instances=%r)' % (
+            type(self).__name__,
+            self.total_bytes,
+            self.shared_bytes,
+            self.instances,
+        )
+
+
+def memory_usage(value):
+    """Compute the memory used by an ADT value.
+
+    Each object is counted once, even if it is reachable along many paths.
+    ADT instances and the builtin containers ``list``, ``tuple``, ``dict``,
+    ``set`` and ``frozenset`` are traversed, other objects are measured with
+    ``sys.getsizeof`` and are not traversed. Deferred fields are not forced.
+
+    Parameters
+    ----------
+    value : ADT
+        The value to measure.
+
+    Returns
+    -------
+    usage : MemoryUsage
+        The memory used by ``value``.
+
+    Examples
+    --------
+    >>> from adt import ADT
+    >>> class List(ADT):
+    ...     Nil()
+    ...     Cons(_1, List[_1])
+    >>> nil = List[int].Nil()
+    >>> usage = memory_usage(List[int].Cons(1, List[int].Cons(2, nil)))
+    >>> usage.instances[List[int].Cons]
+    2
+    >>> usage.instances[List[int].Nil]
+    1
+    """
+    refs = {}
+    instances = {}
+    constructor_bytes = {}
+    total_bytes = 0
+
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        key = id(obj)
+        if key in refs:
+            refs[key] += 1
+            continue
+        refs[key] = 1
+        size = getsizeof(obj)
+        # use ``type`` instead of ``isinstance`` so that we don't force thunks
+        if issubclass(type(obj), _isconstructor):
+            cls = type(obj)
+            args = obj._args
+            kwargs = obj._kwargs
+            # the field storage may be shared with other instances by
+            # ``replace``
+            for storage in args, kwargs:
+                key = id(storage)
+                if key in refs:
+                    refs[key] += 1
+                else:
+                    refs[key] = 1
+                    size += getsizeof(storage)
+
+            instances[cls] = instances.get(cls, 0) + 1
+            constructor_bytes[cls] = constructor_bytes.get(cls, 0) + size
+
+            stack.extend(args)
+            stack.extend(kwargs.values())
+        else:
+            stack.extend(contents(obj))
+        total_bytes += size
+
+    # Walk the graph again to find the bytes which are reachable along more
+    # than one path. An object is shared if it is reached more than once or if
+    # it is reachable from a shared object. Objects which are reached once
+    # have a single parent, so only the shared objects need to be marked as
+    # visited.
+    shared_bytes = 0
+    visited = set()
+    stack = [(value, False)]
+    while stack:
+        obj, shared = stack.pop()
+        key = id(obj)
+        if refs[key] > 1:
+            if key in visited:
+                continue
+            visited.add(key)
+            shared = True
+        if shared:
+            shared_bytes += getsizeof(obj)
+        if not issubclass(type(obj), _isconstructor):
+            stack.extend((ob, shared) for ob in contents(obj))
+            continue
+
+        args = obj._args
+        kwargs = obj._kwargs
+        for storage in args, kwargs:
+            key = id(storage)
+            if refs[key] > 1:
+                if key in visited:
+                    continue
+                visited.add(key)
+            elif not shared:
+                continue
+            shared_bytes += getsizeof(storage)
+
+        stack.extend((ob, shared) for ob in args)
+        stack.extend((ob, shared) for ob in kwargs.values())
+
+    return MemoryUsage(total_bytes, shared_bytes, instances, constructor_bytes)
@@ -1,6 +1,11 @@
+import gc
+import sys
+import weakref
+
+from lazy import thunk
 import pytest
 
-from adt import ADT, match, case
+from adt import ADT, deferred, match, case, memory_usage, replace
 
 
 class List(ADT):
@@ -58,3 +63,296 @@ def test_direct_construction_fails():
         "'Either' is an ADT which can only be instantiated through"
         " constructors: (Left(_1), Right(_2))"
     )
+
+
+class Stream(ADT):
+    Empty()
+    Cons(_1, deferred(Stream[_1]))
+
+
+def test_deferred_field():
+    calls = []
+
+    def ones():
+        calls.append(None)
+        return Stream[int].Cons(1, thunk(ones))
+
+    stream = ones()
+    assert len(calls) == 1
+    assert repr(stream) == 'Stream[int].Cons(1, <deferred>)'
+
+    tail = stream[1]
+    assert len(calls) == 2
+    assert tail[0] == 1
+
+    # the result is cached on the instance
+    assert stream[1] is tail
+    assert len(calls) == 2
+
+
+def test_case_does_not_force_unused_deferred_field():
+    calls = []
+
+    def tail():
+        calls.append(None)
+        return Stream[int].Empty()
+
+    stream = Stream[int].Cons(1, thunk(tail))
+
+    @match(stream)
+    class head(case):
+        Empty() >> None
+        Cons(value, rest) >> value
+
+    assert head == 1
+    assert not calls
+
+    @match(stream)
+    class rest(case):
+        Empty() >> None
+        Cons(value, rest) >> rest
+
+    assert rest is stream[1]
+    assert len(calls) == 1
+
+
+class LazyStruct(ADT):
+    A(a=_1, b=deferred(_1))
+
+
+def test_deferred_keyword_field():
+    s = LazyStruct[int].A(a=1, b=thunk(lambda: 2))
+    assert repr(s) == 'LazyStruct[int].A(a=1, b=<deferred>)'
+    assert s.b == 2
+    assert repr(s) == 'LazyStruct[int].A(a=1, b=2)'
+
+    s = LazyStruct[int].A(a=1, b=thunk(lambda: 'not an int'))
+    with pytest.raises(TypeError) as e:
+        s.b
+
+    assert str(e.value) == (
+        "expected type 'int' for argument at 'b', got 'str': 'not an int'"
+    )
+
+    # non-thunk values are still checked eagerly
+    with pytest.raises(TypeError):
+        LazyStruct[int].A(a=1, b='not an int')
+
+
+class Struct(ADT):
+    A(a=_1, b=_1)
+    B(a=_2, b=_2)
+
+
+def test_replace():
+    s = Struct[int, float].A(a=1, b=2)
+    updated = s.replace(b=3)
+    assert (updated.a, updated.b) == (1, 3)
+    assert (s.a, s.b) == (1, 2)
+    assert type(updated) is type(s)
+    assert replace(s, a=4).a == 4
+
+    with pytest.raises(TypeError) as e:
+        s.replace(a=1.5)
+
+    assert str(e.value) == (
+        "expected type 'int' for argument at 'a', got 'float': 1.5"
+    )
+
+    with pytest.raises(TypeError):
+        s.replace(c=1)
+
+
+def test_replace_positional():
+    ls = List[int].Cons(1, List[int].Nil())
+    updated = ls.replace({0: 2})
+    assert updated[0] == 2
+    assert updated[1] is ls[1]
+    assert ls[0] == 1
+
+    with pytest.raises(TypeError):
+        ls.replace({1: 2})
+
+    with pytest.raises(IndexError):
+        ls.replace({2: 2})
+
+
+class Record(ADT):
+    R(_1, a=_1, b=_1)
+
+
+def test_replace_shares_storage():
+    r = Record[int].R(1, a=2, b=3)
+
+    updated = r.replace(b=4)
+    assert updated._args is r._args
+    assert updated._kwargs == {'a': 2, 'b': 4}
+    assert r._kwargs == {'a': 2, 'b': 3}
+    assert (updated.a, updated.b) == (2, 4)
+
+    updated = r.replace({0: 5})
+    assert updated._kwargs is r._kwargs
+    assert updated[0] == 5
+    assert r[0] == 1
+
+
+class CustomReplace(ADT):
+    A(_1)
+    B(replace=_1)
+
+    def replace(self, value):
+        return 'custom', value
+
+
+def test_replace_does_not_shadow():
+    a = CustomReplace[int].A(1)
+    assert a.replace(2) == ('custom', 2)
+    assert replace(a, {0: 2})[0] == 2
+
+    b = CustomReplace[int].B(replace=1)
+    assert b.replace == 1
+    assert replace(b, replace=2).replace == 2
+
+
+def test_memory_usage():
+    nil = List[int].Nil()
+    tail = List[int].Cons(2, nil)
+    usage = memory_usage(List[int].Cons(1, tail))
+    assert usage.instances == {List[int].Cons: 2, List[int].Nil: 1}
+    assert usage.total_bytes == sum(usage.constructor_bytes.values()) + (
+        sys.getsizeof(1) + sys.getsizeof(2)
+    )
+    assert usage.shared_bytes == 0
+    assert usage.unique_bytes == usage.total_bytes
+
+    # ``tail`` is reachable from both cells but is only counted once
+    shared = memory_usage(Struct[List[int], float].A(
+        a=List[int].Cons(1, tail),
+        b=List[int].Cons(3, tail),
+    ))
+    assert shared.instances[List[int].Cons] == 3
+    assert shared.instances[List[int].Nil] == 1
+    assert shared.shared_bytes > 0
+    assert shared.unique_bytes == shared.total_bytes - shared.shared_bytes
+
+
+def test_memory_usage_containers():
+    inner = [1.5, 2.5]
+    value = Struct[list, float].A(a=[inner, inner], b=[])
+    usage = memory_usage(value)
+    assert usage.total_bytes == sum(usage.constructor_bytes.values()) + sum(
+        map(sys.getsizeof, ([inner, inner], [], inner, 1.5, 2.5)),
+    )
+    # ``inner`` is reachable twice, so it and its elements are shared
+    assert usage.shared_bytes == sum(map(sys.getsizeof, (inner, 1.5, 2.5)))
+
+    # cycles through containers are only counted once
+    cycle = []
+    cycle.append(cycle)
+    usage = memory_usage(Struct[list, float].A(a=cycle, b=[]))
+    assert usage.total_bytes == sum(usage.constructor_bytes.values()) + (
+        sys.getsizeof(cycle) + sys.getsizeof([])
+    )
+
+
+class Expr(ADT):
+    Lit(_1)
+    Add(Expr[_1], Expr[_1])
+
+
+def test_recursive_case():
+    class evaluate(case):
+        Lit(value) >> value
+        Add(lhs, rhs) >> evaluate(lhs) + evaluate(rhs)
+
+    expr = Expr[int].Add(
+        Expr[int].Add(Expr[int].Lit(1), Expr[int].Lit(2)),
+        Expr[int].Lit(3),
+    )
+    assert evaluate(expr) == 6
+
+
+def test_memoized_case():
+    class evaluate(case, memoize=32):
+        Lit(value) >> value
+        Add(lhs, rhs) >> evaluate(lhs) + evaluate(rhs)
+
+    # every node below the top two levels is used by two different parents,
+    # so without the cache the work doubles at each level
+    lhs = Expr[int].Lit(1)
+    rhs = Expr[int].Lit(2)
+    for _ in range(10):
+        lhs, rhs = Expr[int].Add(lhs, rhs), Expr[int].Add(rhs, lhs)
+
+    assert evaluate(lhs) == 3 * 2 ** 9
+    info = evaluate.cache_info()
+    assert info.misses == 21
+    assert info.hits == 18
+    assert info.maxsize == 32
+    assert info.currsize == 21
+
+    assert evaluate(lhs) == 3 * 2 ** 9
+    assert evaluate.cache_info().hits == 19
+
+    evaluate.cache_clear()
+    assert evaluate.cache_info() == (0, 0, 32, 0)
+
+
+def test_memoized_case_bounded():
+    class literal(case, memoize=2):
+        Lit(value) >> value
+        Add(lhs, rhs) >> None
+
+    lits = [Expr[int].Lit(n) for n in range(3)]
+    assert [literal(lit) for lit in lits] == [0, 1, 2]
+    assert literal.cache_info().currsize == 2
+
+    # the least recently used result was evicted
+    assert literal(lits[0]) == 0
+    assert literal.cache_info().misses == 4
+
+
+def test_memoized_case_invalid_maxsize():
+    with pytest.raises(TypeError):
+        class literal(case, memoize=True):
+            Lit(value) >> value
+            Add(lhs, rhs) >> None
+
+    with pytest.raises(ValueError):
+        class literal(case, memoize=0):
+            Lit(value) >> value
+            Add(lhs, rhs) >> None
+
+
+class Atoms(ADT, untrack=True):
+    Nil()
+    Cons(_1, Atoms[_1])
+    Box(value=_1)
+    Lazy(_1, deferred(Atoms[_1]))
+
+
+def test_untrack_atomic_instances():
+    ls = Atoms[int].Cons(1, Atoms[int].Cons(2, Atoms[int].Nil()))
+    assert not gc.is_tracked(ls)
+    assert not gc.is_tracked(ls._args)
+    assert not gc.is_tracked(ls.replace({0: 3}))
+    assert not gc.is_tracked(Atoms[int].Box(value=1))
+
+    # instances which hold containers may be part of a cycle
+    assert gc.is_tracked(Atoms[list].Cons([], Atoms[list].Nil()))
+    assert gc.is_tracked(Atoms[dict].Cons({}, Atoms[dict].Nil()))
+    assert gc.is_tracked(Atoms[object].Box(value=[]))
+
+    # forcing a deferred field may store a container on the instance
+    assert gc.is_tracked(Atoms[int].Lazy(1, thunk(Atoms[int].Nil)))
+
+    # untracking is opt-in
+    assert gc.is_tracked(List[int].Nil())
+
+
+def test_instances_are_immutable():
+    for ls in List[int].Nil(), Atoms[int].Nil():
+        with pytest.raises(AttributeError):
+            ls.attr = ls
+        assert not hasattr(ls, '__dict__')
+        assert weakref.ref(ls)() is ls
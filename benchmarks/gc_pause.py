@@ -0,0 +1,57 @@
+"""Measure the time spent in a full ``gc.collect()`` with a large live heap of
+``List[int]`` nodes.
+
+Usage: python benchmarks/gc_pause.py [nodes]
+"""
+import gc
+import sys
+import time
+
+from adt import ADT
+
+
+class List(ADT):
+    Nil()
+    Cons(_1, List[_1])
+
+
+class UntrackedList(ADT, untrack=True):
+    Nil()
+    Cons(_1, UntrackedList[_1])
+
+
+def build(type_, nodes):
+    ls = type_.Nil()
+    for n in range(nodes):
+        ls = type_.Cons(n, ls)
+    return ls
+
+
+def pause(repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        gc.collect()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(nodes):
+    for type_ in List[int], UntrackedList[int]:
+        start = time.perf_counter()
+        ls = build(type_, nodes)
+        build_time = time.perf_counter() - start
+        seconds = pause()
+        print(
+            '%-18s build: %.4fs  tracked objects: %9d  gc.collect(): %.4fs' % (
+                type_,
+                build_time,
+                len(gc.get_objects()),
+                seconds,
+            ),
+        )
+        del ls
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)